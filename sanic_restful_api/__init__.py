@@ -1,16 +1,15 @@
 from __future__ import absolute_import
-from functools import wraps
+from contextvars import ContextVar
+from copy import copy
+from functools import lru_cache, partial, reduce, wraps
 from sanic.request import Request
 from sanic.exceptions import SanicException as original_sanic_abort
 from sanic.views import HTTPMethodView
-from werkzeug.exceptions import NotAcceptable
-from sanic_restful_api.utils import unpack, accept_mimetypes
+from sanic_restful_api.utils import unpack, best_match_accept_mimetype
 from sanic_restful_api.representations.json import output_json
-from collections import OrderedDict
 from sanic import Blueprint, Sanic
 from sanic.exceptions import ServerError
 from sanic.response import BaseHTTPResponse, text
-from werkzeug.http import parse_accept_header
 try:
     from collections.abc import Mapping
 except ImportError:
@@ -29,6 +28,52 @@ def abort(http_status_code, message=None):
 DEFAULT_REPRESENTATIONS = [('application/json', output_json)]
 
 
+@lru_cache(maxsize=1024)
+def _parse_accept(header, representations, default):
+    """Return the best matching mediatype for a raw Accept header, cached
+    across requests since clients tend to send the same few headers.
+    :param header: the raw value of the Accept header
+    :param representations: tuple of the mediatypes the api can render
+    :param default: value returned if no representation matches
+    """
+    from werkzeug.http import parse_accept_header
+    return parse_accept_header(header).best_match(
+        representations, default=default)
+
+
+HTTP_METHODS = ('get', 'post', 'put', 'patch', 'delete', 'head', 'options')
+
+
+def _response_kind(resource_cls):
+    """Work out once, from the return annotations of the handler methods,
+    what a resource returns.
+    Returns ``'raw'`` if every handler is annotated to return a
+    :class:`sanic.response.BaseHTTPResponse`, ``'data'`` if every handler is
+    annotated to return something else, and ``None`` when it can only be
+    told per request. Resources with representations or decorators are
+    always ``None``, as those may return something other than what the
+    handlers are annotated with.
+    :param resource_cls: the :class:`Resource` class behind a view
+    """
+    if resource_cls is None or any(
+            getattr(resource_cls, attr, None) for attr in (
+                'representations', 'method_decorators', 'decorators')):
+        return None
+    kinds = set()
+    for method in HTTP_METHODS:
+        meth = getattr(resource_cls, method, None)
+        if meth is None:
+            continue
+        annotation = getattr(meth, '__annotations__', {}).get('return')
+        if not isinstance(annotation, type):
+            return None
+        kinds.add('raw' if issubclass(annotation, BaseHTTPResponse)
+                  else 'data')
+    if len(kinds) != 1:
+        return None
+    return kinds.pop()
+
+
 class Api(object):
     """
     The main entry point for the application.
@@ -51,13 +96,20 @@ class Api(object):
         prefix, and 'e' is the path component the endpoint is added with
     """
 
+    mediatypes = (
+        "application/json",
+        "text/plain; charset=utf-8",
+        "application/octet-stream",
+        "text/html; charset=utf-8",
+    )
+
     def __init__(self,
                  app=None,
                  prefix='',
                  default_mediatype="application/json",
                  decorators=None,
                  url_part_order="bae"):
-        self.representations = OrderedDict(DEFAULT_REPRESENTATIONS)
+        self.representations = dict(DEFAULT_REPRESENTATIONS)
         self.urls = {}
         self.prefix = prefix
         self.default_mediatype = default_mediatype
@@ -81,6 +133,7 @@ class Api(object):
             api.add_resource(...)
             api.init_app(app)
         """
+        self._static_prefix, self._static_suffix = self._url_parts('')
         if isinstance(app, Blueprint):
             self.blueprint = app
             self._bp_register = app.register
@@ -122,28 +175,44 @@ class Api(object):
             # Add the url to the application or blueprint
             app.add_route(uri=rule, handler=resource_func, **kwargs)
 
-    @property
-    def mediatypes(self):
-        return [
-            "application/json",
-            "text/plain; charset=utf-8",
-            "application/octet-stream",
-            "text/html; charset=utf-8",
-        ]
-
     def output(self, resource):
         """Wraps a resource (as a sanic view function), for cases where the
         resource does not directly return a response object
         :param resource: The resource as a sanic view function
         """
+        kind = _response_kind(getattr(resource, 'view_class', None))
+
+        if kind == 'raw':
+            @wraps(resource)
+            async def wrapper_raw(request, *args, **kwargs):
+                return await resource(request, *args, **kwargs)
+            wrapper_raw.response_kind = kind
+            return wrapper_raw
+
+        if kind == 'data':
+            @wraps(resource)
+            async def wrapper_data(request, *args, **kwargs):
+                resp = await resource(request, *args, **kwargs)
+                if type(resp) is tuple:
+                    data, code, headers = unpack(resp)
+                else:
+                    data, code, headers = resp, 200, {}
+                return self.make_response(request, data, code,
+                                          headers=headers)
+            wrapper_data.response_kind = kind
+            return wrapper_data
+
         @wraps(resource)
         async def wrapper(request, *args, **kwargs):
             resp = await resource(request, *args, **kwargs)
             if isinstance(resp, BaseHTTPResponse):
                 return resp
-            else:
+            elif type(resp) is tuple:
                 data, code, headers = unpack(resp)
+            else:
+                data, code, headers = resp, 200, {}
             return self.make_response(request, data, code, headers=headers)
+        wrapper.response_kind = kind
         return wrapper
 
     def make_response(self, request, data, *args, **kwargs):
@@ -156,15 +225,17 @@ class Api(object):
         """
         default_mediatype = kwargs.pop("fallback_mediatype",
                                        None) or self.default_mediatype
-        mediatype = parse_accept_header(request.headers.get(
-            'accept', None)).best_match(
-                self.representations, default=default_mediatype)
+        mediatype = _parse_accept(request.headers.get('accept', ''),
+                                  tuple(self.representations),
+                                  default_mediatype)
         if not mediatype:
+            from werkzeug.exceptions import NotAcceptable
             raise NotAcceptable("Not Acceptable")
         if mediatype in self.representations:
-            resp = self.representations[mediatype](request.app, data, *args,
-                                                   **kwargs)
-            resp.headers["Content-type"] = mediatype
+            transformer = self.representations[mediatype]
+            resp = transformer(request.app, data, *args, **kwargs)
+            if getattr(resp, 'content_type', None) != mediatype:
+                resp.headers["Content-Type"] = mediatype
             return resp
         elif mediatype == "text/plain":
             resp = text(str(data), *args, **kwargs)
@@ -179,9 +250,20 @@ class Api(object):
         :param registration_prefix: The part of the url contributed by the
             blueprint.  Generally speaking, BlueprintSetupState.url_prefix
         """
+        if not registration_prefix and 'e' in self.url_part_order:
+            return self._static_prefix + url_part + self._static_suffix
         parts = {'b': registration_prefix, 'a': self.prefix, 'e': url_part}
         return ''.join(parts[key] for key in self.url_part_order if parts[key])
 
+    def _url_parts(self, registration_prefix):
+        """Return the fixed parts of the url that go before and after the
+        endpoint path, as given by :attr:`url_part_order`.
+        """
+        parts = {'b': registration_prefix, 'a': self.prefix}
+        before, _, after = self.url_part_order.partition('e')
+        return (''.join(parts[key] for key in before if parts[key]),
+                ''.join(parts[key] for key in after if parts[key]))
+
     def add_resource(self, resource, *urls, **kwargs):
         """Adds a resource to the api.
         :param resource: the class name of your resource
@@ -246,6 +328,8 @@ class Api(object):
                 resp = make_response(convert_data_to_xml(data), code)
                 resp.headers.extend(headers)
                 return resp
+        The Content-Type header is set to the mediatype after the transformer
+        runs, unless the response was already built with that content type.
         """
 
         def wrapper(func):
@@ -255,6 +339,20 @@ class Api(object):
         return wrapper
 
 
+_current_resource = ContextVar('_current_resource')
+
+
+def _late_bound(func):
+    """Return a coroutine function calling ``func`` on the resource currently
+    being dispatched, so method decorators can be applied to it once per
+    class rather than to a fresh bound method per request.
+    """
+    @wraps(func)
+    async def method(*args, **kwargs):
+        return await func(_current_resource.get(), *args, **kwargs)
+    return method
+
+
 class Resource(HTTPMethodView):
     """
     Represents an abstract RESTful resource. Concrete resources should
@@ -272,34 +370,89 @@ class Resource(HTTPMethodView):
     """
     representations = None
     method_decorators = []
+    _method_table = {}
+    _wrapped_method_table = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._method_table = {
+            method.upper(): getattr(cls, method)
+            for method in HTTP_METHODS if getattr(cls, method, None)}
+        if 'HEAD' not in cls._method_table and 'GET' in cls._method_table:
+            cls._method_table['HEAD'] = cls._method_table['GET']
+        cls._wrapped_method_table = {}
 
     def __init__(self, request: Request, *args, **kwargs):
         self.request = request
 
-    async def dispatch_request(self, request: Request, *args, **kwargs):
-        meth = getattr(self, request.method.lower(), None)
-        if meth is None and request.method == 'HEAD':
-            meth = getattr(self, 'get', None)
-        assert meth is not None, 'Unimplemented method %r' % request.method
-
-        if isinstance(self.method_decorators, Mapping):
-            decorators = self.method_decorators.get(request.method.lower(), [])
+    @staticmethod
+    def _decorators_for(method_decorators, method):
+        if isinstance(method_decorators, Mapping):
+            return method_decorators.get(method.lower(), [])
+        return method_decorators
+
+    @classmethod
+    def _wrapped_method(cls, method):
+        """Return the ``method`` handler wrapped in the class's
+        method_decorators, or None when it has none. The result is built on
+        first use and kept on the class with a copy of the decorators it was
+        built from; it is rebuilt when method_decorators is replaced or the
+        decorators are edited in place.
+        """
+        method_decorators = cls.method_decorators
+        cached = cls._wrapped_method_table.get(method)
+        if cached is not None and cached[0] is method_decorators:
+            key = cached[1]
+            decorators = (method_decorators.get(key, ()) if key
+                          else method_decorators)
+            if decorators == cached[2]:
+                return cached[3]
+
+        if isinstance(method_decorators, Mapping):
+            key = method.lower()
+            decorators = method_decorators.get(key, ())
         else:
-            decorators = self.method_decorators
+            key, decorators = None, method_decorators
+        wrapped = None
+        if decorators:
+            wrapped = reduce(lambda f, d: d(f), decorators,
+                             _late_bound(cls._method_table[method]))
+        cls._wrapped_method_table[method] = (
+            method_decorators, key, copy(decorators), wrapped)
+        return wrapped
 
-        for decorator in decorators:
-            meth = decorator(meth)
-
-        resp = await meth(request, *args, **kwargs)
+    async def dispatch_request(self, request: Request, *args, **kwargs):
+        method = request.method
+        func = self._method_table.get(method)
+        assert func is not None, 'Unimplemented method %r' % method
+
+        if 'method_decorators' in self.__dict__:
+            # decorators set on this instance only apply to this request
+            decorators = self._decorators_for(self.method_decorators, method)
+            meth = reduce(lambda f, d: d(f), decorators, func.__get__(self))
+            resp = await meth(request, *args, **kwargs)
+        else:
+            meth = self._wrapped_method(method)
+            if meth is None:
+                resp = await func(self, request, *args, **kwargs)
+            else:
+                token = _current_resource.set(self)
+                try:
+                    resp = await meth(request, *args, **kwargs)
+                finally:
+                    _current_resource.reset(token)
         if isinstance(resp, BaseHTTPResponse):
             return resp
 
-        representations = self.representations or OrderedDict()
-        mediatype = accept_mimetypes.best_match(
+        representations = self.representations
+        if not representations:
+            return resp
+        mediatype = best_match_accept_mimetype(
             request, representations, default=None)
-        if mediatype in representations:
+        transformer = representations.get(mediatype)
+        if transformer is not None:
             data, code, headers = unpack(resp)
-            resp = representations[mediatype](data, code, headers)
+            resp = transformer(data, code, headers)
             resp.headers['Content-Type'] = mediatype
         return resp
 
@@ -316,25 +469,79 @@ def marshal(data, fields, envelope=None):
     >>> data = { 'a': 100, 'b': 'foo' }
     >>> mfields = { 'a': fields.Raw }
     >>> marshal(data, mfields)
-    OrderedDict([('a', 100)])
+    {'a': 100}
     >>> marshal(data, mfields, envelope='data')
-    OrderedDict([('data', OrderedDict([('a', 100)]))])
+    {'data': {'a': 100}}
     """
+    return _marshal(data, partial(_marshal_one, _compile_fields(fields)),
+                    envelope)
 
-    def make(cls):
-        if isinstance(cls, type):
-            return cls()
-        return cls
 
-    if isinstance(data, (list, tuple)):
-        return (OrderedDict([(envelope, [marshal(d, fields) for d in data])])
-                if envelope else [marshal(d, fields) for d in data])
+def _compile_fields(fields):
+    """Flatten a dict of fields into a plan of ``(key, kind, payload)``
+    entries, so that marshalling many records does not repeat the type checks
+    and field instantiation for each of them. ``kind`` is ``'nested'`` (the
+    payload is the plan of a nested dict) or ``'leaf'`` (the payload is a
+    field instance).
+    """
+    plan = []
+    for k, v in fields.items():
+        if isinstance(v, dict):
+            plan.append((k, 'nested', _compile_fields(v)))
+        else:
+            plan.append((k, 'leaf', v() if isinstance(v, type) else v))
+    return tuple(plan)
+
+
+def _marshal_one(plan, data):
+    return {k: _marshal_one(payload, data) if kind == 'nested'
+            else payload.output(k, data)
+            for k, kind, payload in plan}
+
+
+def _plan_source(plan, namespace):
+    """Return the source of a dict display marshalling one record ``d``
+    with ``plan``, or ``None`` if a key cannot be written as a literal. The
+    bound ``output`` methods of the fields are added to ``namespace``.
+    """
+    items = []
+    for key, kind, payload in plan:
+        if type(key) not in (str, int):
+            return None
+        if kind == 'nested':
+            value = _plan_source(payload, namespace)
+            if value is None:
+                return None
+        else:
+            name = '_f%d' % len(namespace)
+            namespace[name] = payload.output
+            value = '%s(%r, d)' % (name, key)
+        items.append('%r: %s' % (key, value))
+    return '{%s}' % ', '.join(items)
+
 
-    items = ((k, marshal(data, v)
-              if isinstance(v, dict) else make(v).output(k, data))
-             for k, v in fields.items())
-    return OrderedDict(
-        [(envelope, OrderedDict(items))]) if envelope else OrderedDict(items)
+def _compile_marshaller(fields):
+    """Generate a function marshalling one record with ``fields``, where
+    every field lookup is inlined. Falls back to walking the compiled plan
+    when the fields cannot be expressed as source.
+    """
+    plan = _compile_fields(fields)
+    namespace = {}
+    source = _plan_source(plan, namespace)
+    if source is None:
+        return partial(_marshal_one, plan)
+    code = compile('def marshal_one(d):\n    return %s\n' % source,
+                   '<marshal_with>', 'exec')
+    exec(code, namespace)
+    return namespace['marshal_one']
+
+
+def _marshal(data, marshal_one, envelope=None):
+    if isinstance(data, (list, tuple)):
+        items = [_marshal(d, marshal_one) for d in data]
+    else:
+        items = marshal_one(data)
+    return {envelope: items} if envelope else items
 
 
 class marshal_with(object):
@@ -347,14 +554,14 @@ class marshal_with(object):
     ...
     ...
     >>> get()
-    OrderedDict([('a', 100)])
+    {'a': 100}
     >>> @marshal_with(mfields, envelope='data')
     ... def get():
     ...     return { 'a': 100, 'b': 'foo' }
     ...
     ...
     >>> get()
-    OrderedDict([('data', OrderedDict([('a', 100)]))])
+    {'data': {'a': 100}}
     see :meth:`sanic_restful_api.marshal`
     """
 
@@ -367,19 +574,18 @@ class marshal_with(object):
         """
         self.fields = fields
         self.envelope = envelope
+        self._compiled = _compile_marshaller(fields)
 
     def __call__(self, f):
         @wraps(f)
         async def wrapper(*args, **kwargs):
-            _cls = args[0] if args else None
-            if isinstance(_cls, Resource):
-                pass
             resp = await f(*args, **kwargs)
-            if isinstance(resp, tuple):
+            if type(resp) is tuple:
                 data, code, headers = unpack(resp)
-                return marshal(data, self.fields, self.envelope), code, headers
+                return _marshal(data, self._compiled, self.envelope), \
+                    code, headers
             else:
-                return marshal(resp, self.fields, self.envelope)
+                return _marshal(resp, self._compiled, self.envelope)
 
         return wrapper
 
@@ -411,7 +617,7 @@ class marshal_with_field(object):
         @wraps(f)
         async def wrapper(*args, **kwargs):
             resp = await f(*args, **kwargs)
-            if isinstance(resp, tuple):
+            if type(resp) is tuple:
                 data, code, headers = unpack(resp)
                 return self.field.format(data), code, headers
             return self.field.format(resp)
@@ -3,7 +3,7 @@ from calendar import timegm
 from decimal import Decimal as MyDecimal, ROUND_HALF_EVEN
 from email.utils import formatdate
 import six
-from sanic_restful_api import marshal
+from sanic_restful_api import marshal, _compile_marshaller, _marshal
 
 __all__ = ["String", "FormattedString", "DateTime", "Float",
            "Integer", "Arbitrary", "Nested", "List", "Raw", "Boolean",
@@ -133,11 +133,22 @@ class Nested(Raw):
         null)
     """
 
+    _compiled = None
+
     def __init__(self, nested, allow_null=False, **kwargs):
         self.nested = nested
         self.allow_null = allow_null
         super(Nested, self).__init__(**kwargs)
 
+    def _marshaller(self):
+        """Return the function marshalling one record with :attr:`nested`,
+        compiled on first use and again only if :attr:`nested` is replaced.
+        """
+        nested = self.nested
+        if self._compiled is None or self._compiled[0] is not nested:
+            self._compiled = (nested, _compile_marshaller(nested))
+        return self._compiled[1]
+
     def output(self, key, obj):
         value = get_value(
             key if self.attribute is None else self.attribute, obj)
@@ -147,7 +158,7 @@ class Nested(Raw):
             elif self.default is not None:
                 return self.default
 
-        return marshal(value, self.nested)
+        return _marshal(value, self._marshaller())
 
 
 class List(Raw):
@@ -198,7 +209,7 @@ class List(Raw):
         if value is None:
             return self.default
 
-        return [marshal(value, self.container.nested)]
+        return [_marshal(value, self.container._marshaller())]
 
 
 class String(Raw):
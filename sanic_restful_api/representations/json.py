@@ -1,15 +1,27 @@
 import orjson
 from sanic.response import HTTPResponse
 
+_dumps = orjson.dumps
+
+
+def _get_settings(app):
+    """Read the orjson options from ``RESTFUL_JSON`` once and keep them on
+    the app context for later responses."""
+    settings = getattr(app.ctx, '_restful_json_opt', None)
+    if settings is None:
+        settings = app.config.get(
+            'RESTFUL_JSON', orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
+        app.ctx._restful_json_opt = settings
+    return settings
+
 
 def output_json(app, data, code, headers=None):
-    settings = app.config.get(
-        'RESTFUL_JSON', orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS)
-    dumped = orjson.dumps(data, option=settings)
+    dumped = _dumps(data, option=_get_settings(app))
     resp = HTTPResponse(
         dumped,
         status=code,
         content_type="application/json",
     )
-    resp.headers.extend(headers or {})
+    if headers:
+        resp.headers.extend(headers)
     return resp
@@ -1,10 +1,8 @@
 import collections
-try:
-    from collections import MutableSequence
-except Exception:
-    from collections.abc import MutableSequence
-from copy import deepcopy
+from collections.abc import MutableSequence
+from copy import copy
 import decimal
+import inspect
 try:
     from sanic.exceptions import abort
 except Exception:
@@ -33,6 +31,48 @@ _friendly_location = {
 }
 
 
+def _location_value(request, location, loc_cache=None):
+    """Return the value of ``location`` on the request, calling it if it is
+    a method, and reusing the value stored in ``loc_cache`` if any.
+    """
+    if loc_cache is not None and location in loc_cache:
+        return loc_cache[location]
+    value = getattr(request, location, None)
+    if callable(value):
+        value = value()
+    if loc_cache is not None:
+        loc_cache[location] = value
+    return value
+
+
+def _collect_all_locations(request, locations=('json', 'form', 'args', 'files'),
+                           loc_cache=None):
+    """Merge the values found in each of ``locations`` into one
+    :class:`RequestParameters`, the last location taking precedence. With a
+    ``loc_cache`` the merged result is kept under the ``locations`` tuple.
+    """
+    cacheable = loc_cache is not None and type(locations) is tuple
+    if cacheable and locations in loc_cache:
+        return loc_cache[locations]
+    values = RequestParameters()
+    for l in locations:
+        value = _location_value(request, l, loc_cache)
+        if value:
+            values.update(value)
+    if cacheable:
+        loc_cache[locations] = values
+    return values
+
+
+def _is_choice(value, choices):
+    """Membership test for ``choices`` that also works for unhashable values
+    such as lists from a JSON body, when the choices are a frozenset."""
+    try:
+        return value in choices
+    except TypeError:
+        return any(value == choice for choice in choices)
+
+
 class Argument(object):
 
     """
@@ -68,6 +108,12 @@ class Argument(object):
     :param bool nullable: If enabled, allows null value in argument.
     """
 
+    __slots__ = ('_name', 'default', 'dest', 'required', 'ignore', 'location',
+                 '_type', '_choices', 'action', 'help', '_case_sensitive',
+                 '_operators', 'store_missing', 'trim', 'nullable',
+                 'ignore_invalid_usage', '_op_keys', '_choices_lower',
+                 '_converter')
+
     def __init__(self,
                  name,
                  default=None,
@@ -85,24 +131,114 @@ class Argument(object):
                  trim=False,
                  nullable=True,
                  ignore_invalid_usage=True):
-        self.name = name
+        self._name = name
         self.default = default
         self.dest = dest
         self.required = required
         self.ignore = ignore
         self.location = location
-        self.type = type
-        self.choices = choices
+        self._type = type
+        self._choices = choices
         self.action = action
         self.help = help
-        self.case_sensitive = case_sensitive
-        self.operators = operators
+        self._case_sensitive = case_sensitive
+        self._operators = operators
         self.store_missing = store_missing
         self.trim = trim
         self.nullable = nullable
         self.ignore_invalid_usage = ignore_invalid_usage
+        self._refresh_op_keys()
+        self._refresh_choices()
+        self._converter = self._make_converter(type)
+
+    # name, type, operators, choices and case_sensitive are properties so
+    # that what parse() precomputes from them follows later assignments
+
+    @property
+    def name(self):
+        return self._name
+
+    @name.setter
+    def name(self, value):
+        self._name = value
+        self._refresh_op_keys()
+        self._converter = self._make_converter(self._type)
+
+    @property
+    def type(self):
+        return self._type
+
+    @type.setter
+    def type(self, value):
+        self._type = value
+        self._converter = self._make_converter(value)
+
+    @property
+    def operators(self):
+        return self._operators
+
+    @operators.setter
+    def operators(self, value):
+        self._operators = value
+        self._refresh_op_keys()
+
+    @property
+    def choices(self):
+        return self._choices
+
+    @choices.setter
+    def choices(self, value):
+        self._choices = value
+        self._refresh_choices()
+
+    @property
+    def case_sensitive(self):
+        return self._case_sensitive
+
+    @case_sensitive.setter
+    def case_sensitive(self, value):
+        self._case_sensitive = value
+        self._refresh_choices()
+
+    def _refresh_op_keys(self):
+        self._op_keys = tuple(
+            (operator, self._name + operator.replace("=", "", 1))
+            for operator in self._operators)
+
+    def _refresh_choices(self):
+        choices = self._choices
+        self._choices_lower = choices
+        if not self._case_sensitive and hasattr(choices, "__iter__"):
+            choices_lower = [choice.lower() if hasattr(choice, "lower")
+                             else choice for choice in choices]
+            try:
+                self._choices_lower = frozenset(choices_lower)
+            except TypeError:
+                self._choices_lower = choices_lower
 
-    def source(self, request):
+    def clone(self):
+        """Return a copy of this argument. List, dict and set values of
+        ``choices``, ``default``, ``location`` and ``operators`` are copied so
+        that editing them on one argument leaves the other alone; other
+        values are shared, as parsing does not modify them.
+        """
+        cls = self.__class__
+        new = cls.__new__(cls)
+        for klass in cls.__mro__:
+            slots = klass.__dict__.get('__slots__', ())
+            for attr in (slots,) if isinstance(slots, str) else slots:
+                if attr not in ('__dict__', '__weakref__') \
+                        and hasattr(self, attr):
+                    setattr(new, attr, getattr(self, attr))
+        if hasattr(self, '__dict__'):
+            new.__dict__.update(self.__dict__)
+        for attr in ('choices', 'default', 'location', 'operators'):
+            value = getattr(new, attr)
+            if isinstance(value, (list, dict, set)):
+                setattr(new, attr, copy(value))
+        return new
+
+    def source(self, request, loc_cache=None):
         """Pulls values off the request in the provided location
         if location is str:
             json -> dict
@@ -110,29 +246,23 @@ class Argument(object):
         if location is sequence:
             return RequestParameters
         :param request: The sanic request object to parse arguments from
+        :param loc_cache: optional dict shared by the arguments of one
+            :meth:`RequestParser.parse_args` call, so each location is only
+            read off the request once
         """
-        if isinstance(self.location, str):
+        if type(self.location) is str:
             try:
-                value = getattr(request, self.location, RequestParameters())
+                value = _location_value(request, self.location, loc_cache)
             except InvalidUsage as e:
                 if self.ignore_invalid_usage:
                     return RequestParameters()
                 else:
                     raise e
 
-            if callable(value):
-                value = value()
             if value:
                 return value
         else:
-            values = RequestParameters()
-            for l in self.location:
-                value = getattr(request, l, None)
-                if callable(value):
-                    value = value()
-                if value:
-                    values.update(value)
-            return values
+            return _collect_all_locations(request, self.location, loc_cache)
 
         return RequestParameters()
 
@@ -145,18 +275,48 @@ class Argument(object):
             else:
                 raise ValueError("Must not be null")
 
-        try:
-            if not self.type:
-                return value
-            return self.type(value, self.name, op)
-        except TypeError:
+        if self._converter is None:
+            return value
+        return self._converter(value, op)
+
+    def _make_converter(self, func):
+        """Work out once how the argument's ``type`` is called: with the
+        value, argument name and operator, with the value and name, or with
+        the value alone, depending on what it requires. When that cannot be
+        told from the signature, the calls are tried in that order.
+        """
+        if not func:
+            return None
+        name = self._name
+        if func is decimal.Decimal:
+            return lambda value, op: func(str(value))
+        if isinstance(func, type) and func.__module__ == 'builtins':
+            return lambda value, op: func(value)
+
+        def convert(value, op):
             try:
-                if self.type is decimal.Decimal:
-                    return self.type(str(value), self.name)
-                else:
-                    return self.type(value, self.name)
+                return func(value, name, op)
             except TypeError:
-                return self.type(value)
+                try:
+                    return func(value, name)
+                except TypeError:
+                    return func(value)
+
+        try:
+            params = list(inspect.signature(func).parameters.values())
+        except (TypeError, ValueError):
+            return convert
+
+        positional = [p for p in params
+                      if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD)]
+        if any(p.kind is p.VAR_POSITIONAL for p in params) or any(
+                p.default is not p.empty for p in positional[1:]):
+            return convert
+        if len(positional) >= 3:
+            return lambda value, op: func(value, name, op)
+        if len(positional) == 2:
+            return lambda value, op: func(value, name)
+        return lambda value, op: func(value)
 
     def handle_validation_error(self, app, error, bundle_errors):
         """Called when an error is raised while parsing. Aborts the request
@@ -169,19 +329,20 @@ class Argument(object):
         error_msg = self.help.format(error_msg=error) if self.help else error
         msg = {self.name: error_msg}
 
-        if app.config.get("BUNDLE_ERRORS", False) or bundle_errors:
+        if bundle_errors:
             return error, msg
         abort(status_code=400, message=msg)
 
-    def parse(self, request, req_temp, bundle_errors=False):
+    def parse(self, request, req_temp, bundle_errors=None, loc_cache=None):
         """Parses argument value(s) from the request, converting according to
         the argument's type.
         :param request: The sanic request object to parse arguments from
-        :param do not abort when first error occurs, return a
+        :param bundle_errors: do not abort when first error occurs, return a
             dict with the name of the argument and the error message to be
-            bundled
+            bundled. If ``None``, the app's BUNDLE_ERRORS config is used
+        :param loc_cache: see :meth:`source`
         """
-        source = self.source(request)
+        source = self.source(request, loc_cache)
 
         results = []
 
@@ -189,55 +350,57 @@ class Argument(object):
         _not_found = False
         _found = True
 
-        for operator in self.operators:
-            name = self.name + operator.replace("=", "", 1)
+        trim = self.trim
+        case_sensitive = self._case_sensitive
+        choices = self._choices if case_sensitive else self._choices_lower
+        action = self.action
+        unparsed = req_temp.unparsed_arguments
+        bundle = bundle_errors
+        if bundle is None:
+            bundle = request.app.config.get("BUNDLE_ERRORS", False)
+
+        for operator, name in self._op_keys:
             if name in source:
                 # Account for MultiDict and regular dict
                 if hasattr(source, "getlist") and not isinstance(source, Header):
                     values = source.getlist(name)
                 else:
                     values = source.get(name)
-                    if not (isinstance(values, MutableSequence)
-                            and self.action == 'append'):
-                        values = [values]
+                    if not (action == 'append' and (
+                            type(values) is list
+                            or isinstance(values, MutableSequence))):
+                        values = (values,)
 
                 for value in values:
-                    if hasattr(value, "strip") and self.trim:
+                    if trim and type(value) is str:
                         value = value.strip()
-                    if hasattr(value, "lower") and not self.case_sensitive:
+                    if not case_sensitive and type(value) is str \
+                            and not value.islower():
                         value = value.lower()
 
-                        if hasattr(self.choices, "__iter__"):
-                            self.choices = [choice.lower()
-                                            for choice in self.choices]
-
                     try:
                         value = self.convert(value, operator)
                     except Exception as error:
                         if self.ignore:
                             continue
                         return self.handle_validation_error(
-                            request.app, error, bundle_errors)
+                            request.app, error, bundle)
 
-                    if self.choices and value not in self.choices:
-                        if request.app.config.get("BUNDLE_ERRORS",
-                                                  False) or bundle_errors:
+                    if choices and not _is_choice(value, choices):
+                        error = ValueError(
+                            "{0} is not a valid choice".format(value))
+                        if bundle:
                             return self.handle_validation_error(
-                                request.app,
-                                ValueError("{0} is not a valid choice".format(
-                                    value)), bundle_errors)
+                                request.app, error, bundle)
                         self.handle_validation_error(
-                            request.app,
-                            ValueError(
-                                "{0} is not a valid choice".format(value)),
-                            bundle_errors)
+                            request.app, error, bundle)
 
-                    if name in req_temp.unparsed_arguments:
-                        req_temp.unparsed_arguments.pop(name)
+                    if name in unparsed:
+                        unparsed.pop(name)
                     results.append(value)
 
         if not results and self.required:
-            if isinstance(self.location, str):
+            if type(self.location) is str:
                 error_msg = "Missing required parameter in {0}".format(
                     _friendly_location.get(self.location, self.location)
                 )
@@ -247,12 +410,12 @@ class Argument(object):
                 error_msg = "Missing required parameter in {0}".format(
                     ' or '.join(friendly_locations)
                 )
-            if request.app.config.get("BUNDLE_ERRORS", False) or bundle_errors:
+            if bundle:
                 return self.handle_validation_error(request.app,
                                                     ValueError(error_msg),
-                                                    bundle_errors)
+                                                    bundle)
             self.handle_validation_error(request.app, ValueError(error_msg),
-                                         bundle_errors)
+                                         bundle)
 
         if not results:
             if callable(self.default):
@@ -260,14 +423,67 @@ class Argument(object):
             else:
                 return self.default, _not_found
 
-        if self.action == 'append':
+        if action == 'append':
             return results, _found
 
-        if self.action == 'store' or len(results) == 1:
+        if action == 'store' or len(results) == 1:
             return results[0], _found
         return results, _found
 
 
+class _ReqTemp(object):
+    """Holds the request arguments not yet consumed during a
+    :meth:`RequestParser.parse_args` call."""
+    __slots__ = ('unparsed_arguments',)
+
+
+class _ArgumentDict(dict):
+    """Dict of a parser's arguments that also keeps them as a list of
+    ``(name, argument)`` pairs for :meth:`RequestParser.parse_args` to
+    iterate, dropping that list whenever the dict is changed."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._pairs = None
+
+    def pairs(self):
+        if self._pairs is None:
+            self._pairs = list(self.items())
+        return self._pairs
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._pairs = None
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._pairs = None
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, *args):
+        self._pairs = None
+        return super().pop(*args)
+
+    def popitem(self):
+        self._pairs = None
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self._pairs = None
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._pairs = None
+
+    def clear(self):
+        super().clear()
+        self._pairs = None
+
+
 class RequestParser:
     """Enables adding and parsing of multiple arguments in the context of a
     single request. Ex::
@@ -294,6 +510,16 @@ class RequestParser:
         self.trim = trim
         self.bundle_errors = bundle_errors
 
+    @property
+    def args(self):
+        """The parser's arguments, keyed by name."""
+        return self._args
+
+    @args.setter
+    def args(self, value):
+        self._args = value if isinstance(value, _ArgumentDict) \
+            else _ArgumentDict(value)
+
     def add_argument(self, *args, **kwargs) -> None:
         """Adds an argument to be parsed.
         Accepts either a single instance of Argument or arguments to be passed
@@ -325,13 +551,18 @@ class RequestParser:
 
         # A record of arguments not yet parsed; as each is found
         # among self.args, it will be popped out
-        req_temp = collections.namedtuple('RedType', 'unparsed_arguments')
+        req_temp = _ReqTemp()
+        loc_cache = {}
         req_temp.unparsed_arguments = dict(
-            self.argument_cls('').source(request)) if strict else {}
+            _collect_all_locations(request, loc_cache=loc_cache)) \
+            if strict else {}
         errors = {}
+        bundle = self.bundle_errors or request.app.config.get(
+            "BUNDLE_ERRORS", False)
 
-        for name, arg in self.args.items():
-            value, found = arg.parse(request, req_temp, self.bundle_errors)
+        for name, arg in self.args.pairs():
+            value, found = arg.parse(request, req_temp, bundle,
+                                     loc_cache=loc_cache)
             if isinstance(value, ValueError):
                 errors.update(found)
                 found = None
@@ -354,7 +585,7 @@ class RequestParser:
         the same set of arguments
         """
         parser_copy = self.__class__(self.argument_cls, self.namespace_cls)
-        parser_copy.args = deepcopy(self.args)
+        parser_copy.args = {k: v.clone() for k, v in self.args.items()}
         parser_copy.trim = self.trim
         parser_copy.bundle_errors = self.bundle_errors
         return parser_copy
@@ -1,27 +1,29 @@
-from werkzeug.http import HTTP_STATUS_CODES
+import re
+from http import HTTPStatus
+
+# media range of each comma separated Accept item, without its parameters
+_ACCEPT_TOKEN = re.compile(r'\s*([^,;\s]+)[^,]*')
+_WILDCARD = frozenset(("*", "*/*", "*.*"))
 
 
 def http_status_message(code):
     """Maps an HTTP status code to the textual status"""
-    return HTTP_STATUS_CODES.get(code, '')
+    try:
+        return HTTPStatus(code).phrase
+    except ValueError:
+        return ''
 
 
 def unpack(value):
     """Return a three tuple of data, code, and headers"""
-    if not isinstance(value, tuple):
+    if type(value) is not tuple:
         return value, 200, {}
 
-    try:
-        data, code, headers = value
-        return data, code, headers
-    except ValueError:
-        pass
-
-    try:
-        data, code = value
-        return data, code, {}
-    except ValueError:
-        pass
+    n = len(value)
+    if n == 3:
+        return value
+    if n == 2:
+        return value[0], value[1], {}
 
     return value, 200, {}
 
@@ -37,12 +39,12 @@ def best_match_accept_mimetype(request, representations, default=None):
     if not representations:
         return default
     try:
-        accept_mimetypes = get_accept_mimetypes(request)
-        if not accept_mimetypes:
+        accept_types = request.headers.get('accept', None)
+        if not accept_types:
             return default
-        accept_mimetypes = [s.split(';')[0] for s in accept_mimetypes]
-        for accept_type in accept_mimetypes:
-            if accept_type == "*" or accept_type == "*/*" or accept_type == "*.*":
+        for match in _ACCEPT_TOKEN.finditer(accept_types):
+            accept_type = match.group(1)
+            if accept_type in _WILDCARD:
                 return default
             elif accept_type in representations:
                 return accept_type